@@ -2,7 +2,7 @@
 Coding challenge API endpoints.
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 import uuid
@@ -23,6 +23,20 @@ logger = structlog.get_logger()
 
 router = APIRouter()
 
+# Static lookup lists, built once at import instead of on every request
+# This would typically come from a database query; for now, return common categories
+CHALLENGE_CATEGORIES = [
+    "Array", "String", "Linked List", "Tree", "Graph", "Dynamic Programming",
+    "Sorting", "Searching", "Hash Table", "Stack", "Queue", "Heap",
+    "Greedy", "Backtracking", "Bit Manipulation", "Math", "Two Pointers",
+    "Sliding Window", "Binary Search", "Recursion"
+]
+SUPPORTED_LANGUAGES = [lang.value for lang in LanguageType]
+DIFFICULTY_LEVELS = [diff.value for diff in DifficultyLevel]
+
+# The lookup lists only change on deploy, so clients may reuse them for an hour
+LOOKUP_CACHE_CONTROL = "private, max-age=3600"
+
 
 # Challenge Management Endpoints
 
@@ -476,39 +490,29 @@ async def bulk_create_challenges(
 
 @router.get("/categories", response_model=List[str])
 async def get_challenge_categories(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    response: Response,
+    current_user: User = Depends(get_current_user)
 ):
     """Get all available challenge categories."""
-    try:
-        # This would typically come from a database query
-        # For now, return common categories
-        categories = [
-            "Array", "String", "Linked List", "Tree", "Graph", "Dynamic Programming",
-            "Sorting", "Searching", "Hash Table", "Stack", "Queue", "Heap",
-            "Greedy", "Backtracking", "Bit Manipulation", "Math", "Two Pointers",
-            "Sliding Window", "Binary Search", "Recursion"
-        ]
-        return categories
-    except Exception as e:
-        logger.error("Failed to get categories", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve categories"
-        )
+    response.headers["Cache-Control"] = LOOKUP_CACHE_CONTROL
+    return CHALLENGE_CATEGORIES
 
 
 @router.get("/languages", response_model=List[str])
 async def get_supported_languages(
+    response: Response,
     current_user: User = Depends(get_current_user)
 ):
     """Get all supported programming languages."""
-    return [lang.value for lang in LanguageType]
+    response.headers["Cache-Control"] = LOOKUP_CACHE_CONTROL
+    return SUPPORTED_LANGUAGES
 
 
 @router.get("/difficulties", response_model=List[str])
 async def get_difficulty_levels(
+    response: Response,
     current_user: User = Depends(get_current_user)
 ):
     """Get all difficulty levels."""
-    return [diff.value for diff in DifficultyLevel]
\ No newline at end of file
+    response.headers["Cache-Control"] = LOOKUP_CACHE_CONTROL
+    return DIFFICULTY_LEVELS
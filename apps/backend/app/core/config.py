@@ -9,6 +9,7 @@ class Settings(BaseSettings):
     # Environment
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
+    TESTING: bool = False
     
     # API Configuration
     API_V1_STR: str = "/api/v1"
@@ -52,7 +53,8 @@ class Settings(BaseSettings):
     CODE_EXECUTION_MEMORY_LIMIT: str = "128m"
     
     # ML Models
-    WHISPER_MODEL: str = "base"
+    WHISPER_MODEL: str = "base.en"
+    WHISPER_CPU_THREADS: int = 4
     SPACY_MODEL: str = "en_core_web_sm"
     
     class Config:
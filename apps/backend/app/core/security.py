@@ -10,8 +10,12 @@ from email_validator import validate_email, EmailNotValidError
 from app.core.config import settings
 
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context; test runs use bcrypt's minimum cost so test users are cheap to create
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    **({"bcrypt__rounds": 4} if settings.TESTING else {})
+)
 
 
 class SecurityUtils:
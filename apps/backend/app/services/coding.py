@@ -55,27 +55,26 @@ class CodingService:
                 solution_approach=challenge_data.solution_approach,
                 hints=challenge_data.hints,
                 is_active=challenge_data.is_active,
-                created_by=created_by
+                created_by=created_by,
+                # Attach test cases through the relationship so the commit's single flush
+                # inserts the challenge and then all of its test cases as one batch
+                test_cases=[
+                    TestCase(
+                        input_data=test_case_data.input_data,
+                        expected_output=test_case_data.expected_output,
+                        is_sample=test_case_data.is_sample,
+                        is_hidden=test_case_data.is_hidden,
+                        weight=test_case_data.weight,
+                        explanation=test_case_data.explanation
+                    )
+                    for test_case_data in challenge_data.test_cases
+                ]
             )
             
             self.db.add(challenge)
-            await self.db.flush()  # Get the challenge ID
-            
-            # Create test cases
-            for test_case_data in challenge_data.test_cases:
-                test_case = TestCase(
-                    challenge_id=challenge.id,
-                    input_data=test_case_data.input_data,
-                    expected_output=test_case_data.expected_output,
-                    is_sample=test_case_data.is_sample,
-                    is_hidden=test_case_data.is_hidden,
-                    weight=test_case_data.weight,
-                    explanation=test_case_data.explanation
-                )
-                self.db.add(test_case)
-            
             await self.db.commit()
             await self.db.refresh(challenge)
+            await self._load_test_cases(challenge)
             
             logger.info("Created coding challenge", challenge_id=challenge.id, title=challenge.title)
             return challenge
@@ -95,6 +94,11 @@ class CodingService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
+    async def _load_test_cases(self, challenge: CodingChallenge) -> None:
+        """Load a challenge's test cases in one query after a refresh."""
+        # Responses include test_cases, and a lazy load during serialization fails on AsyncSession
+        await self.db.refresh(challenge, attribute_names=["test_cases"])
+    
     async def get_challenges(
         self, 
         filters: CodingChallengeFilters,
@@ -170,6 +174,7 @@ class CodingService:
             challenge.updated_at = datetime.utcnow()
             await self.db.commit()
             await self.db.refresh(challenge)
+            await self._load_test_cases(challenge)
             
             logger.info("Updated coding challenge", challenge_id=challenge_id)
             return challenge
@@ -31,7 +31,7 @@ from app.schemas.communication import (
     CommunicationSessionCreate,
     CommunicationSessionUpdate,
 )
-from app.services.speech_processing import speech_processor
+from app.services.speech_processing import get_speech_processor
 
 logger = logging.getLogger(__name__)
 
@@ -333,6 +333,7 @@ class CommunicationService:
             await db.commit()
             
             # Transcribe audio
+            speech_processor = get_speech_processor()
             transcript, confidence, detailed_results = await speech_processor.transcribe_audio(
                 recording.audio_file_path
             )
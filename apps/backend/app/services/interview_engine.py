@@ -20,7 +20,7 @@ from app.schemas.interview import (
     InterviewQuestionCreate, InterviewResponseCreate
 )
 from app.services.groq_client import GroqClient
-from app.services.speech_processing import SpeechProcessor
+from app.services.speech_processing import get_speech_processor
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -32,7 +32,7 @@ class InterviewEngine:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.groq_client = GroqClient()
-        self.speech_processor = SpeechProcessor()
+        self.speech_processor = get_speech_processor()
         
         # Enhanced question generation templates for different scenarios
         self.question_templates = {
@@ -1,23 +1,107 @@
 """Skill extraction and keyword matching service."""
 
-import re
+import sys
 import json
+import hashlib
+import functools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Dict, List, Set, Tuple, Optional
 from pathlib import Path
 import logging
 
+import ahocorasick
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Number of distinct texts whose extraction results are kept in memory
+EXTRACTION_CACHE_SIZE = 512
+
+# Phrases that signal a skill is used in a meaningful context
+CONTEXT_TEMPLATES = (
+    "experienced in {0}",
+    "proficient in {0}",
+    "expert in {0}",
+    "skilled in {0}",
+    "knowledge of {0}",
+    "using {0}",
+    "with {0}",
+    "{0} development",
+    "{0} programming"
+)
+
+
+@dataclass(slots=True, frozen=True)
+class SkillHit:
+    """A skill found in a text, kept compact and immutable inside the extraction cache."""
+    
+    name: str
+    confidence: float
+    category: Optional[str] = None
+    industry: Optional[str] = None
+    
+    def as_dict(self) -> Dict[str, any]:
+        """Return the record in the dict shape exposed by extract_skills."""
+        record = {"name": self.name}
+        if self.category is not None:
+            record["category"] = self.category
+        if self.industry is not None:
+            record["industry"] = self.industry
+        record["confidence"] = self.confidence
+        return record
+
+
+@functools.lru_cache(maxsize=128)
+def _build_keyword_automaton(keywords: Tuple[str, ...]) -> "ahocorasick.Automaton":
+    """Build (and cache) an automaton over a set of lower-cased target keywords."""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
 
 class SkillExtractor:
     """Service for extracting and matching skills from resume text."""
     
+    # Automaton over the static vocabulary, built once and shared by every instance
+    _automaton: Optional["ahocorasick.Automaton"] = None
+    
     def __init__(self):
         """Initialize skill extractor with predefined skill databases."""
-        self.technical_skills = self._load_technical_skills()
-        self.soft_skills = self._load_soft_skills()
-        self.industry_keywords = self._load_industry_keywords()
-        self.job_title_keywords = self._load_job_title_keywords()
+        # Vocabulary entries are lower-case and interned so name comparisons hit the identity fast path
+        self.technical_skills = {
+            category: self._intern_all(skills)
+            for category, skills in self._load_technical_skills().items()
+        }
+        self.soft_skills = self._intern_all(self._load_soft_skills())
+        self.industry_keywords = {
+            industry: self._intern_all(keywords)
+            for industry, keywords in self._load_industry_keywords().items()
+        }
+        self.job_title_keywords = {
+            role: self._intern_all(keywords)
+            for role, keywords in self._load_job_title_keywords().items()
+        }
+        if type(self)._automaton is None:
+            type(self)._automaton = self._build_automaton()
+        vocabulary = list(dict.fromkeys(entry[3] for entry in self._iter_vocabulary()))
+        self._skill_names = tuple(vocabulary)
+        self._skill_index = {name: index for index, name in enumerate(vocabulary)}
+        
+        # Output slots per skill, so extraction only visits the skills a text actually contains
+        self._skill_entries: Dict[str, List[Tuple[int, str, Optional[str], Optional[str]]]] = {}
+        for position, (bucket, group_key, group, skill) in enumerate(self._iter_vocabulary()):
+            self._skill_entries.setdefault(skill, []).append((position, bucket, group_key, group))
+        self._extraction_cache: "OrderedDict[bytes, Dict[str, Tuple[SkillHit, ...]]]" = OrderedDict()
+        self._extraction_cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _intern_all(skills: List[str]) -> List[str]:
+        """Return the skills as lower-case interned strings."""
+        return [sys.intern(skill.lower()) for skill in skills]
     
     def _load_technical_skills(self) -> Dict[str, List[str]]:
         """Load technical skills database."""
@@ -132,98 +216,145 @@ class SkillExtractor:
             ]
         }
     
+    def _iter_vocabulary(self):
+        """Yield (bucket, group_key, group, skill) for every extractable skill in output order."""
+        for category, skills in self.technical_skills.items():
+            for skill in skills:
+                yield "technical", "category", category, skill
+        
+        for skill in self.soft_skills:
+            yield "soft", None, None, skill
+        
+        for industry, keywords in self.industry_keywords.items():
+            for keyword in keywords:
+                yield "industry_specific", "industry", industry, keyword
+    
+    def _build_automaton(self) -> "ahocorasick.Automaton":
+        """Build one Aho-Corasick automaton over every skill, its spelling variants and context phrases."""
+        automaton = ahocorasick.Automaton()
+        
+        def add(pattern: str, skill: str, kind: str) -> None:
+            payload = automaton.get(pattern, ())
+            automaton.add_word(pattern, payload + ((skill, kind),))
+        
+        for skill in {entry[3] for entry in self._iter_vocabulary()}:
+            if " " in skill:
+                # Multi-word skills match as plain phrases or their common variations
+                variants = {
+                    skill,
+                    skill.replace(" ", "-"),
+                    skill.replace(" ", "_"),
+                    skill.replace(".", "")
+                }
+                kind = "phrase"
+            else:
+                # Single words must sit on word boundaries to avoid partial matches
+                variants = {skill}
+                kind = "word"
+            
+            for variant in variants:
+                add(variant, skill, kind)
+            
+            for template in CONTEXT_TEMPLATES:
+                add(template.format(skill), skill, "context")
+        
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        """Mirror the regex definition of a word character used by \\b."""
+        return char.isalnum() or char == "_"
+    
+    def _scan_skills(self, text: str) -> Tuple[Dict[str, int], Set[str]]:
+        """Sweep the text once; return occurrence counts per skill and the skills seen in context."""
+        counts: Dict[str, int] = {}
+        in_context: Set[str] = set()
+        is_word = self._is_word_char
+        last = len(text) - 1
+        
+        for end, matches in self._automaton.iter(text):
+            for skill, kind in matches:
+                if kind == "context":
+                    in_context.add(skill)
+                    continue
+                if kind == "word":
+                    start = end - len(skill) + 1
+                    before = is_word(text[start - 1]) if start > 0 else False
+                    after = is_word(text[end + 1]) if end < last else False
+                    if before == is_word(skill[0]) or after == is_word(skill[-1]):
+                        continue
+                counts[skill] = counts.get(skill, 0) + 1
+        
+        return counts, in_context
+    
     def extract_skills(self, text: str) -> Dict[str, List[str]]:
         """Extract skills from resume text."""
         text_lower = text.lower()
         
+        # Job descriptions are matched against many resumes, so results are cached by text digest
+        key = hashlib.blake2b(text_lower.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._extraction_cache_lock:
+            extracted_skills = self._extraction_cache.get(key)
+            if extracted_skills is not None:
+                self._extraction_cache.move_to_end(key)
+        
+        if extracted_skills is None:
+            extracted_skills = self._extract_skills_uncached(text_lower)
+            with self._extraction_cache_lock:
+                self._extraction_cache[key] = extracted_skills
+                if len(self._extraction_cache) > EXTRACTION_CACHE_SIZE:
+                    self._extraction_cache.popitem(last=False)
+        
+        # Cached hits are immutable; callers get fresh dicts they are free to modify
+        return {
+            bucket: [hit.as_dict() for hit in hits]
+            for bucket, hits in extracted_skills.items()
+        }
+    
+    def _extract_skills_uncached(self, text_lower: str) -> Dict[str, Tuple[SkillHit, ...]]:
+        """Extract skills from already lower-cased text."""
+        skill_counts, in_context = self._scan_skills(text_lower)
+        
         extracted_skills = {
             "technical": [],
             "soft": [],
             "industry_specific": []
         }
         
-        # Extract technical skills
-        for category, skills in self.technical_skills.items():
-            for skill in skills:
-                if self._is_skill_present(skill, text_lower):
-                    extracted_skills["technical"].append({
-                        "name": skill,
-                        "category": category,
-                        "confidence": self._calculate_skill_confidence(skill, text_lower)
-                    })
-        
-        # Extract soft skills
-        for skill in self.soft_skills:
-            if self._is_skill_present(skill, text_lower):
-                extracted_skills["soft"].append({
-                    "name": skill,
-                    "confidence": self._calculate_skill_confidence(skill, text_lower)
-                })
+        # Emit hits in vocabulary order without walking categories that had no matches
+        found = sorted(
+            (entry + (skill,) for skill in skill_counts for entry in self._skill_entries[skill]),
+            key=lambda entry: entry[0]
+        )
         
-        # Extract industry-specific skills
-        for industry, keywords in self.industry_keywords.items():
-            for keyword in keywords:
-                if self._is_skill_present(keyword, text_lower):
-                    extracted_skills["industry_specific"].append({
-                        "name": keyword,
-                        "industry": industry,
-                        "confidence": self._calculate_skill_confidence(keyword, text_lower)
-                    })
+        for _, bucket, group_key, group, skill in found:
+            count = skill_counts[skill]
+            confidence = self._calculate_skill_confidence(count, skill in in_context)
+            if group_key:
+                hit = SkillHit(skill, confidence, **{group_key: group})
+            else:
+                hit = SkillHit(skill, confidence)
+            extracted_skills[bucket].append(hit)
         
-        return extracted_skills
+        return {bucket: tuple(hits) for bucket, hits in extracted_skills.items()}
     
-    def _is_skill_present(self, skill: str, text: str) -> bool:
-        """Check if a skill is present in the text."""
-        # Handle multi-word skills
-        if " " in skill:
-            # For multi-word skills, check for exact phrase or variations
-            patterns = [
-                skill,
-                skill.replace(" ", "-"),
-                skill.replace(" ", "_"),
-                skill.replace(".", "")
-            ]
-            return any(pattern in text for pattern in patterns)
-        else:
-            # For single words, use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            return bool(re.search(pattern, text, re.IGNORECASE))
-    
-    def _calculate_skill_confidence(self, skill: str, text: str) -> float:
-        """Calculate confidence score for skill extraction."""
-        # Count occurrences
-        count = text.count(skill.lower())
-        
+    def _calculate_skill_confidence(self, count: int, in_context: bool) -> float:
+        """Calculate confidence score from a skill's occurrence count and context."""
         # Base confidence on frequency and context
         confidence = min(count * 0.3 + 0.7, 1.0)
         
         # Boost confidence if skill appears in context
-        context_patterns = [
-            f"experienced in {skill}",
-            f"proficient in {skill}",
-            f"expert in {skill}",
-            f"skilled in {skill}",
-            f"knowledge of {skill}",
-            f"using {skill}",
-            f"with {skill}",
-            f"{skill} development",
-            f"{skill} programming"
-        ]
-        
-        for pattern in context_patterns:
-            if pattern in text:
-                confidence = min(confidence + 0.2, 1.0)
-                break
+        if in_context:
+            confidence = min(confidence + 0.2, 1.0)
         
         return round(confidence, 2)
     
     def match_job_requirements(self, extracted_skills: Dict[str, List[str]], 
                               job_description: str) -> Dict[str, any]:
         """Match extracted skills against job requirements."""
-        job_text = job_description.lower()
-        
-        # Extract required skills from job description
-        required_skills = self.extract_skills(job_text)
+        # Extract required skills from job description (extract_skills lower-cases it)
+        required_skills = self.extract_skills(job_description)
         
         # Calculate match scores
         technical_match = self._calculate_match_score(
@@ -266,6 +397,24 @@ class SkillExtractor:
             "skill_gap_analysis": self._generate_skill_gap_analysis(extracted_skills, required_skills)
         }
     
+    def _skill_mask(self, skills: List[Dict]) -> int:
+        """Build a bitmask over the skill vocabulary; unknown skill names are ignored."""
+        mask = 0
+        for skill in skills:
+            index = self._skill_index.get(skill["name"])
+            if index is not None:
+                mask |= 1 << index
+        return mask
+    
+    def _mask_names(self, mask: int, limit: Optional[int] = None) -> List[str]:
+        """Decode a vocabulary bitmask into skill names, in vocabulary order."""
+        names = []
+        while mask and (limit is None or len(names) < limit):
+            lowest = mask & -mask
+            names.append(self._skill_names[lowest.bit_length() - 1])
+            mask ^= lowest
+        return names
+    
     def _calculate_match_score(self, candidate_skills: List[Dict], required_skills: List[Dict]) -> float:
         """Calculate match score between candidate and required skills."""
         if not required_skills:
@@ -274,30 +423,29 @@ class SkillExtractor:
         if not candidate_skills:
             return 0.0
         
-        candidate_skill_names = {skill["name"].lower() for skill in candidate_skills}
-        required_skill_names = {skill["name"].lower() for skill in required_skills}
+        required_mask = self._skill_mask(required_skills)
+        required_count = required_mask.bit_count()
+        if not required_count:
+            return 100.0
         
-        matched_skills = candidate_skill_names.intersection(required_skill_names)
-        match_score = (len(matched_skills) / len(required_skill_names)) * 100
+        matched_count = (self._skill_mask(candidate_skills) & required_mask).bit_count()
+        match_score = (matched_count / required_count) * 100
         
         return match_score
     
     def _find_missing_skills(self, candidate_skills: List[Dict], required_skills: List[Dict]) -> List[str]:
         """Find skills that are required but missing from candidate."""
-        candidate_skill_names = {skill["name"].lower() for skill in candidate_skills}
-        required_skill_names = {skill["name"].lower() for skill in required_skills}
-        
-        missing = required_skill_names - candidate_skill_names
-        return list(missing)
+        missing = self._skill_mask(required_skills) & ~self._skill_mask(candidate_skills)
+        return self._mask_names(missing)
     
     def _find_matched_skills(self, candidate_skills: Dict, required_skills: Dict) -> Dict[str, List[str]]:
         """Find skills that match between candidate and requirements."""
         matched = {"technical": [], "soft": [], "industry_specific": []}
         
         for category in matched.keys():
-            candidate_names = {skill["name"].lower() for skill in candidate_skills.get(category, [])}
-            required_names = {skill["name"].lower() for skill in required_skills.get(category, [])}
-            matched[category] = list(candidate_names.intersection(required_names))
+            candidate_mask = self._skill_mask(candidate_skills.get(category, []))
+            required_mask = self._skill_mask(required_skills.get(category, []))
+            matched[category] = self._mask_names(candidate_mask & required_mask)
         
         return matched
     
@@ -311,16 +459,17 @@ class SkillExtractor:
         
         # Identify strengths
         for category, skills in candidate_skills.items():
-            high_confidence_skills = [skill for skill in skills if skill.get("confidence", 0) > 0.8]
-            if high_confidence_skills:
-                analysis["strengths"].append(f"Strong {category} skills: {', '.join([s['name'] for s in high_confidence_skills[:3]])}")
+            confidence = np.fromiter((skill.get("confidence", 0) for skill in skills), dtype=float, count=len(skills))
+            high_confidence = np.flatnonzero(confidence > 0.8)[:3]
+            if high_confidence.size:
+                analysis["strengths"].append(f"Strong {category} skills: {', '.join(skills[i]['name'] for i in high_confidence)}")
         
         # Identify gaps
         for category, skills in required_skills.items():
-            candidate_names = {skill["name"].lower() for skill in candidate_skills.get(category, [])}
-            missing = [skill["name"] for skill in skills if skill["name"].lower() not in candidate_names]
+            missing_mask = self._skill_mask(skills) & ~self._skill_mask(candidate_skills.get(category, []))
+            missing = self._mask_names(missing_mask, limit=3)
             if missing:
-                analysis["gaps"].append(f"Missing {category} skills: {', '.join(missing[:3])}")
+                analysis["gaps"].append(f"Missing {category} skills: {', '.join(missing)}")
         
         # Generate recommendations
         if analysis["gaps"]:
@@ -346,10 +495,10 @@ class SkillExtractor:
                     break
             
             # Check for missing role-specific skills
-            candidate_technical = {skill["name"].lower() for skill in extracted_skills.get("technical", [])}
+            candidate_technical = {skill["name"] for skill in extracted_skills.get("technical", [])}
             
             for keyword in role_keywords:
-                if keyword.lower() not in candidate_technical:
+                if keyword not in candidate_technical:
                     suggestions.append({
                         "type": "missing_skill",
                         "skill": keyword,
@@ -380,12 +529,15 @@ class SkillExtractor:
     def generate_keyword_optimization_report(self, text: str, target_keywords: List[str]) -> Dict[str, any]:
         """Generate keyword optimization report."""
         text_lower = text.lower()
+        keywords_lower = [keyword.lower() for keyword in target_keywords]
+        keyword_counts = self._count_keywords(text_lower, keywords_lower)
+        word_count = len(text.split())
         
         # Analyze current keyword usage
         keyword_analysis = {}
-        for keyword in target_keywords:
-            count = text_lower.count(keyword.lower())
-            density = (count / len(text.split())) * 100 if text else 0
+        for keyword, keyword_lower in zip(target_keywords, keywords_lower):
+            count = keyword_counts.get(keyword_lower, 0)
+            density = (count / word_count) * 100 if word_count else 0
             
             keyword_analysis[keyword] = {
                 "count": count,
@@ -415,7 +567,20 @@ class SkillExtractor:
             "missing_keywords": len(target_keywords) - present_keywords
         }
     
-    def _get_optimal_keyword_density(self, keyword: str) -> float:
+    def _count_keywords(self, text: str, keywords: List[str]) -> Dict[str, int]:
+        """Count occurrences of lower-cased keywords in a single pass over lower-cased text."""
+        patterns = tuple(dict.fromkeys(keyword for keyword in keywords if keyword))
+        counts = dict.fromkeys(patterns, 0)
+        
+        if patterns:
+            for _, keyword in _build_keyword_automaton(patterns).iter(text):
+                counts[keyword] += 1
+        
+        return counts
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _get_optimal_keyword_density(keyword: str) -> float:
         """Get optimal keyword density for ATS optimization."""
         # General rule: 1-3% density for important keywords
         if len(keyword.split()) > 1:  # Multi-word keywords
@@ -2,6 +2,7 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
+import asyncio
 import structlog
 import time
 from contextlib import asynccontextmanager
@@ -9,6 +10,7 @@ from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.core.database import init_db
 from app.api.v1.router import api_router
+from app.services.speech_processing import get_speech_processor
 
 # Configure structured logging
 structlog.configure(
@@ -38,6 +40,9 @@ async def lifespan(app: FastAPI):
     logger.info("Starting PlacementPrep API server")
     await init_db()
     logger.info("Database initialized")
+    # Load Whisper and spaCy before serving so the first request does not block the event loop on them
+    await asyncio.to_thread(get_speech_processor)
+    logger.info("Speech models loaded")
     
     yield
     
@@ -3,11 +3,11 @@
 Simple test script to validate the content management API implementation
 """
 
+import re
 import sys
-import os
 
-# Add the backend directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+# Path parameters are compared by position only, not by name
+PATH_PARAM_RE = re.compile(r"\{[^}]+\}")
 
 def test_imports():
     """Test that all modules can be imported successfully"""
@@ -96,7 +96,7 @@ def test_api_structure():
         assert isinstance(router, APIRouter), "Router should be an APIRouter instance"
         
         # Check that routes are registered
-        routes = [route.path for route in router.routes]
+        routes = {PATH_PARAM_RE.sub("{}", route.path) for route in router.routes}
         expected_routes = [
             "/questions",
             "/questions/search", 
@@ -113,11 +113,13 @@ def test_api_structure():
             "/companies"
         ]
         
-        for expected_route in expected_routes:
-            # Check if route exists (allowing for parameter variations)
-            route_found = any(expected_route.replace("{question_id}", ".*") in route for route in routes)
-            if not route_found:
-                print(f"⚠️  Route {expected_route} not found in registered routes")
+        # Check that every route exists (allowing for parameter name variations)
+        missing_routes = [
+            expected_route for expected_route in expected_routes
+            if PATH_PARAM_RE.sub("{}", expected_route) not in routes
+        ]
+        if missing_routes:
+            print(f"⚠️  Routes not found in registered routes: {', '.join(missing_routes)}")
         
         print("✓ API routes are properly registered")
         print("✅ API structure validation successful!")
@@ -4,12 +4,13 @@ Test script for Interview API endpoints
 """
 
 import asyncio
+import re
 import sys
 import os
-from pathlib import Path
 
-# Add the app directory to Python path
-sys.path.insert(0, str(Path(__file__).parent / "app"))
+# Path parameters are compared by position only, not by name
+PATH_PARAM_RE = re.compile(r"\{[^}]+\}")
+
 
 async def test_interview_api():
     """Test interview API functionality"""
@@ -53,6 +54,16 @@ async def test_interview_api():
         for route in routes:
             print(f"  - {route}")
         
+        registered = {PATH_PARAM_RE.sub("{}", route) for route in routes}
+        missing_routes = [
+            route for route in expected_routes
+            if PATH_PARAM_RE.sub("{}", route) not in registered
+        ]
+        if missing_routes:
+            print(f"⚠ Expected routes not registered: {', '.join(missing_routes)}")
+        else:
+            print("✓ All expected routes registered")
+        
         # Check for WebSocket route
         websocket_routes = [route for route in router.routes if hasattr(route, 'path') and 'realtime' in route.path]
         if websocket_routes:
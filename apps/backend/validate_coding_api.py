@@ -2,11 +2,26 @@
 """
 Validation script for coding challenge API implementation.
 """
+import ast
+import functools
+import re
 import sys
-import importlib.util
 from typing import List, Dict, Any
 
 
+@functools.lru_cache(maxsize=None)
+def _read(path: str) -> str:
+    """Read a source file once; later checks on the same file reuse its text."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=None)
+def _parse(path: str) -> ast.Module:
+    """Parse a source file once and return its syntax tree."""
+    return ast.parse(_read(path), filename=path)
+
+
 def validate_schemas():
     """Validate coding schemas."""
     print("🧪 Validating coding schemas...")
@@ -54,16 +69,11 @@ def validate_service_structure():
     print("🧪 Validating coding service structure...")
     
     try:
-        # Import the service module
-        spec = importlib.util.spec_from_file_location(
-            "coding_service", 
-            "app/services/coding.py"
-        )
-        coding_service_module = importlib.util.module_from_spec(spec)
-        
-        # Check if we can load the module
-        with open("app/services/coding.py", 'r') as f:
-            content = f.read()
+        # Collect every async method defined in the service
+        defined_methods = {
+            node.name for node in ast.walk(_parse("app/services/coding.py"))
+            if isinstance(node, ast.AsyncFunctionDef)
+        }
         
         # Check for required methods
         required_methods = [
@@ -81,9 +91,9 @@ def validate_service_structure():
             "detect_plagiarism"
         ]
         
-        for method in required_methods:
-            if f"async def {method}" not in content:
-                raise ValueError(f"Missing required method: {method}")
+        missing_methods = [method for method in required_methods if method not in defined_methods]
+        if missing_methods:
+            raise ValueError(f"Missing required methods: {', '.join(missing_methods)}")
         
         print("✅ Coding service structure validated successfully")
         return True
@@ -97,31 +107,47 @@ def validate_api_endpoints():
     print("🧪 Validating API endpoint structure...")
     
     try:
-        with open("app/api/v1/endpoints/coding.py", 'r') as f:
-            content = f.read()
+        # Collect (method, path) for every @router.<method>("<path>", ...) decorator
+        registered_endpoints = set()
+        for node in ast.walk(_parse("app/api/v1/endpoints/coding.py")):
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            for decorator in node.decorator_list:
+                if (
+                    isinstance(decorator, ast.Call)
+                    and isinstance(decorator.func, ast.Attribute)
+                    and isinstance(decorator.func.value, ast.Name)
+                    and decorator.func.value.id == "router"
+                    and decorator.args
+                    and isinstance(decorator.args[0], ast.Constant)
+                ):
+                    registered_endpoints.add((decorator.func.attr, decorator.args[0].value))
         
         # Check for required endpoints
         required_endpoints = [
-            "@router.post(\"/challenges\"",
-            "@router.get(\"/challenges\"",
-            "@router.get(\"/challenges/{challenge_id}\"",
-            "@router.put(\"/challenges/{challenge_id}\"",
-            "@router.delete(\"/challenges/{challenge_id}\"",
-            "@router.post(\"/submissions\"",
-            "@router.get(\"/submissions/{submission_id}\"",
-            "@router.get(\"/submissions\"",
-            "@router.get(\"/challenges/{challenge_id}/analytics\"",
-            "@router.get(\"/users/me/stats\"",
-            "@router.get(\"/submissions/{submission_id}/quality\"",
-            "@router.get(\"/submissions/{submission_id}/plagiarism\"",
-            "@router.get(\"/categories\"",
-            "@router.get(\"/languages\"",
-            "@router.get(\"/difficulties\""
+            ("post", "/challenges"),
+            ("get", "/challenges"),
+            ("get", "/challenges/{challenge_id}"),
+            ("put", "/challenges/{challenge_id}"),
+            ("delete", "/challenges/{challenge_id}"),
+            ("post", "/submissions"),
+            ("get", "/submissions/{submission_id}"),
+            ("get", "/submissions"),
+            ("get", "/challenges/{challenge_id}/analytics"),
+            ("get", "/users/me/stats"),
+            ("get", "/submissions/{submission_id}/quality"),
+            ("get", "/submissions/{submission_id}/plagiarism"),
+            ("get", "/categories"),
+            ("get", "/languages"),
+            ("get", "/difficulties")
         ]
         
-        for endpoint in required_endpoints:
-            if endpoint not in content:
-                raise ValueError(f"Missing required endpoint: {endpoint}")
+        missing_endpoints = [
+            f"{method.upper()} {path}" for method, path in required_endpoints
+            if (method, path) not in registered_endpoints
+        ]
+        if missing_endpoints:
+            raise ValueError(f"Missing required endpoints: {', '.join(missing_endpoints)}")
         
         print("✅ API endpoint structure validated successfully")
         return True
@@ -135,8 +161,20 @@ def validate_migration():
     print("🧪 Validating database migration...")
     
     try:
-        with open("alembic/versions/0003_create_coding_challenge_schema.py", 'r') as f:
-            content = f.read()
+        # Collect created tables (op.create_table("<name>", ...)) and enum types (ENUM(..., name="<name>"))
+        created_tables = set()
+        created_enums = set()
+        for node in ast.walk(_parse("alembic/versions/0003_create_coding_challenge_schema.py")):
+            if not isinstance(node, ast.Call) or not isinstance(node.func, (ast.Attribute, ast.Name)):
+                continue
+            func_name = node.func.attr if isinstance(node.func, ast.Attribute) else node.func.id
+            if func_name == "create_table" and node.args and isinstance(node.args[0], ast.Constant):
+                created_tables.add(node.args[0].value)
+            elif func_name in ("ENUM", "Enum"):
+                created_enums.update(
+                    keyword.value.value for keyword in node.keywords
+                    if keyword.arg == "name" and isinstance(keyword.value, ast.Constant)
+                )
         
         # Check for required tables
         required_tables = [
@@ -147,7 +185,7 @@ def validate_migration():
         ]
         
         for table in required_tables:
-            if f"'{table}'" not in content:
+            if table not in created_tables:
                 raise ValueError(f"Missing required table: {table}")
         
         # Check for required enums
@@ -158,7 +196,7 @@ def validate_migration():
         ]
         
         for enum in required_enums:
-            if enum not in content:
+            if enum not in created_enums:
                 raise ValueError(f"Missing required enum: {enum}")
         
         print("✅ Database migration validated successfully")
@@ -173,8 +211,7 @@ def validate_router_integration():
     print("🧪 Validating router integration...")
     
     try:
-        with open("app/api/v1/router.py", 'r') as f:
-            content = f.read()
+        content = _read("app/api/v1/router.py")
         
         # Check if coding module is imported and included
         if "from app.api.v1.endpoints import auth, users, content, aptitude, coding" not in content:
@@ -195,8 +232,7 @@ def validate_schema_exports():
     print("🧪 Validating schema exports...")
     
     try:
-        with open("app/schemas/__init__.py", 'r') as f:
-            content = f.read()
+        content = _read("app/schemas/__init__.py")
         
         # Check if coding schemas are imported and exported
         coding_imports = [
@@ -208,9 +244,14 @@ def validate_schema_exports():
             "CodingChallengeFilters"
         ]
         
-        for import_name in coding_imports:
-            if import_name not in content:
-                raise ValueError(f"Missing schema export: {import_name}")
+        # One pass over the file finds every exported name; word boundaries keep e.g.
+        # "CodingChallenge" from matching inside "CodingChallengeCreate"
+        export_re = re.compile(r"\b(" + "|".join(map(re.escape, coding_imports)) + r")\b")
+        exported_names = set(export_re.findall(content))
+        
+        missing_exports = [name for name in coding_imports if name not in exported_names]
+        if missing_exports:
+            raise ValueError(f"Missing schema exports: {', '.join(missing_exports)}")
         
         print("✅ Schema exports validated successfully")
         return True
@@ -5,328 +5,383 @@ Validates that all task requirements are met.
 """
 
 import asyncio
+import functools
 import json
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, Callable, FrozenSet, List, NamedTuple, Tuple
 
-def validate_task_requirements():
-    """Validate that all task 8.2 requirements are implemented."""
+# Resolve the application modules once; the validators report the failure if any of them is missing
+try:
+    from sqlalchemy import inspect as sa_inspect
     
-    print("🔍 Validating Mock Interview API Implementation (Task 8.2)")
-    print("=" * 60)
+    from app.api.v1.endpoints.interview import router
+    from app.services.ai_interviewer import AIInterviewer
+    from app.services.performance_analyzer import PerformanceAnalyzer
+    from app.services.interview_engine import InterviewEngine
+    from app.services.groq_client import GroqClient
+    from app.models.interview import InterviewSession, InterviewQuestion, InterviewResponse
+    _IMPORT_ERROR = None
+except Exception as e:
+    # Settings validation and native library load errors surface here too, not only ImportError
+    _IMPORT_ERROR = e
+
+# Report lines are buffered and written to stdout in one call per validator
+_out: List[str] = []
+emit = _out.append
+
+def _flush_output():
+    """Write the buffered report lines to stdout and reset the buffer."""
+    if _out:
+        sys.stdout.write("\n".join(_out))
+        sys.stdout.write("\n")
+        _out.clear()
+
+class RouteIndex(NamedTuple):
+    """Route lookups shared by both validators."""
+    paths: FrozenSet[str]
+    method_paths: FrozenSet[Tuple[str, str]]
+    has_realtime: bool
+
+def _index_router(router) -> RouteIndex:
+    """Index the router's paths, (method, path) pairs and realtime route in one pass."""
+    paths = set()
+    method_paths = set()
+    has_realtime = False
+    for route in router.routes:
+        paths.add(route.path)
+        method_paths.update(
+            (method, route.path)
+            for method in (getattr(route, 'methods', None) or {'GET'})
+            if method != 'HEAD'  # Skip HEAD methods
+        )
+        has_realtime = has_realtime or "/realtime" in route.path
+    return RouteIndex(frozenset(paths), frozenset(method_paths), has_realtime)
+
+def _declared_methods(cls) -> set:
+    """Collect every attribute name declared on a class or its bases."""
+    return set().union(*(vars(base) for base in cls.__mro__))
+
+def _model_attrs(model) -> set:
+    """Collect the mapped attribute names of a SQLAlchemy model."""
+    return set(sa_inspect(model).attrs.keys())
+
+class Check(NamedTuple):
+    """One validation step: its result key, report wording and check function."""
+    key: str
+    title: str
+    met: str
+    not_met: str
+    required: bool  # Counts towards task 8.2 completion
+    run: Callable[[RouteIndex], bool]
+
+def _check_session_endpoints(routes: RouteIndex) -> bool:
+    """Interview session management endpoints."""
+    session_endpoints = [
+        "/sessions",
+        "/sessions/{session_id}",
+        "/sessions/{session_id}/start",
+        "/sessions/{session_id}/pause", 
+        "/sessions/{session_id}/resume",
+        "/sessions/{session_id}/complete"
+    ]
     
-    requirements = {
-        "interview_session_management": False,
-        "real_time_ai_interviewer": False,
-        "performance_analysis": False,
-        "feedback_recommendations": False,
-        "interview_history_tracking": False
-    }
+    return set(session_endpoints).issubset(routes.paths)
+
+def _check_realtime(routes: RouteIndex) -> bool:
+    """Real-time AI interviewer interaction."""
+    # Check for WebSocket endpoint
+    websocket_endpoint = "/sessions/{session_id}/realtime"
+    has_websocket = websocket_endpoint in routes.paths
     
-    try:
-        # Test 1: Interview Session Management Endpoints
-        print("\n1. Testing Interview Session Management...")
-        from app.api.v1.endpoints.interview import router
-        
-        # Check for session management endpoints
-        session_endpoints = [
-            "/sessions",
-            "/sessions/{session_id}",
-            "/sessions/{session_id}/start",
-            "/sessions/{session_id}/pause", 
-            "/sessions/{session_id}/resume",
-            "/sessions/{session_id}/complete"
-        ]
-        
-        router_paths = [route.path for route in router.routes]
-        session_management_complete = all(endpoint in router_paths for endpoint in session_endpoints)
-        
-        if session_management_complete:
-            requirements["interview_session_management"] = True
-            print("   ✓ Session management endpoints implemented")
-        else:
-            print("   ✗ Missing session management endpoints")
-        
-        # Test 2: Real-time AI Interviewer Interaction
-        print("\n2. Testing Real-time AI Interviewer...")
-        
-        # Check for WebSocket endpoint
-        websocket_endpoint = "/sessions/{session_id}/realtime"
-        has_websocket = websocket_endpoint in router_paths
-        
-        # Check for AI interviewer service
-        from app.services.ai_interviewer import AIInterviewer
-        ai_methods = [
-            "generate_introduction",
-            "generate_immediate_feedback", 
-            "generate_question_transition",
-            "generate_completion_summary",
-            "generate_hint"
-        ]
-        
-        ai_interviewer_complete = all(hasattr(AIInterviewer, method) for method in ai_methods)
-        
-        if has_websocket and ai_interviewer_complete:
-            requirements["real_time_ai_interviewer"] = True
-            print("   ✓ Real-time AI interviewer implemented")
-        else:
-            print("   ✗ Real-time AI interviewer incomplete")
-        
-        # Test 3: Performance Analysis and Scoring
-        print("\n3. Testing Performance Analysis...")
-        
-        analysis_endpoints = [
-            "/sessions/{session_id}/performance-analysis",
-            "/analytics"
-        ]
-        
-        has_analysis_endpoints = all(endpoint in router_paths for endpoint in analysis_endpoints)
-        
-        # Check performance analyzer service
-        from app.services.performance_analyzer import PerformanceAnalyzer
-        analyzer_methods = [
-            "generate_comprehensive_analysis",
-            "_calculate_performance_metrics",
-            "_analyze_by_category",
-            "_analyze_timing_patterns"
-        ]
-        
-        analyzer_complete = all(hasattr(PerformanceAnalyzer, method) for method in analyzer_methods)
-        
-        if has_analysis_endpoints and analyzer_complete:
-            requirements["performance_analysis"] = True
-            print("   ✓ Performance analysis implemented")
-        else:
-            print("   ✗ Performance analysis incomplete")
-        
-        # Test 4: Feedback and Improvement Recommendations
-        print("\n4. Testing Feedback and Recommendations...")
-        
-        feedback_endpoints = [
-            "/sessions/{session_id}/improvement-plan"
-        ]
-        
-        has_feedback_endpoints = all(endpoint in router_paths for endpoint in feedback_endpoints)
-        
-        # Check for feedback generation methods
-        feedback_methods = [
-            "generate_improvement_plan",
-            "_generate_detailed_recommendations",
-            "_identify_strengths_weaknesses"
-        ]
-        
-        feedback_complete = all(hasattr(PerformanceAnalyzer, method) for method in feedback_methods)
-        
-        if has_feedback_endpoints and feedback_complete:
-            requirements["feedback_recommendations"] = True
-            print("   ✓ Feedback and recommendations implemented")
-        else:
-            print("   ✗ Feedback and recommendations incomplete")
-        
-        # Test 5: Interview History and Progress Tracking
-        print("\n5. Testing History and Progress Tracking...")
-        
-        history_endpoints = [
-            "/sessions",  # Get user sessions
-            "/sessions/{session_id}/progress-tracking"
-        ]
-        
-        has_history_endpoints = all(endpoint in router_paths for endpoint in history_endpoints)
-        
-        # Check for progress tracking methods
-        from app.services.interview_engine import InterviewEngine
-        from app.services.performance_analyzer import PerformanceAnalyzer
-        
-        # Check interview engine methods
-        engine_methods = ["_get_session"]
-        engine_complete = all(hasattr(InterviewEngine, method) for method in engine_methods)
-        
-        # Check performance analyzer methods for trends
-        trend_methods = ["_analyze_performance_trends"]
-        trend_complete = all(hasattr(PerformanceAnalyzer, method) for method in trend_methods)
-        
-        tracking_complete = engine_complete and trend_complete
-        
-        if has_history_endpoints and tracking_complete:
-            requirements["interview_history_tracking"] = True
-            print("   ✓ History and progress tracking implemented")
-        else:
-            print("   ✗ History and progress tracking incomplete")
-        
-        # Test 6: Check Database Models
-        print("\n6. Testing Database Models...")
-        
-        from app.models.interview import InterviewSession, InterviewQuestion, InterviewResponse
-        
-        # Check essential model fields
-        session_fields = ["interview_type", "status", "overall_score", "ai_feedback"]
-        question_fields = ["question_text", "category", "difficulty_level", "generated_by_ai"]
-        response_fields = ["response_text", "overall_score", "ai_feedback", "improvement_suggestions"]
-        
-        models_complete = (
-            all(hasattr(InterviewSession, field) for field in session_fields) and
-            all(hasattr(InterviewQuestion, field) for field in question_fields) and
-            all(hasattr(InterviewResponse, field) for field in response_fields)
-        )
-        
-        if models_complete:
-            print("   ✓ Database models properly defined")
-        else:
-            print("   ✗ Database models incomplete")
-        
-        # Test 7: Check AI Integration
-        print("\n7. Testing AI Integration...")
-        
-        from app.services.groq_client import GroqClient
-        
-        ai_methods = [
-            "generate_interview_questions",
-            "analyze_interview_response", 
-            "generate_followup_question"
-        ]
-        
-        ai_integration_complete = all(hasattr(GroqClient, method) for method in ai_methods)
-        
-        if ai_integration_complete:
-            print("   ✓ AI integration implemented")
+    # Check for AI interviewer service
+    ai_methods = [
+        "generate_introduction",
+        "generate_immediate_feedback", 
+        "generate_question_transition",
+        "generate_completion_summary",
+        "generate_hint"
+    ]
+    
+    return has_websocket and set(ai_methods).issubset(_declared_methods(AIInterviewer))
+
+def _check_performance_analysis(routes: RouteIndex) -> bool:
+    """Performance analysis and scoring."""
+    analysis_endpoints = [
+        "/sessions/{session_id}/performance-analysis",
+        "/analytics"
+    ]
+    
+    has_analysis_endpoints = set(analysis_endpoints).issubset(routes.paths)
+    
+    # Check performance analyzer service
+    analyzer_methods = [
+        "generate_comprehensive_analysis",
+        "_calculate_performance_metrics",
+        "_analyze_by_category",
+        "_analyze_timing_patterns"
+    ]
+    
+    return has_analysis_endpoints and set(analyzer_methods).issubset(_declared_methods(PerformanceAnalyzer))
+
+def _check_feedback(routes: RouteIndex) -> bool:
+    """Feedback and improvement recommendations."""
+    feedback_endpoints = [
+        "/sessions/{session_id}/improvement-plan"
+    ]
+    
+    has_feedback_endpoints = set(feedback_endpoints).issubset(routes.paths)
+    
+    # Check for feedback generation methods
+    feedback_methods = [
+        "generate_improvement_plan",
+        "_generate_detailed_recommendations",
+        "_identify_strengths_weaknesses"
+    ]
+    
+    return has_feedback_endpoints and set(feedback_methods).issubset(_declared_methods(PerformanceAnalyzer))
+
+def _check_history(routes: RouteIndex) -> bool:
+    """Interview history and progress tracking."""
+    history_endpoints = [
+        "/sessions",  # Get user sessions
+        "/sessions/{session_id}/progress-tracking"
+    ]
+    
+    has_history_endpoints = set(history_endpoints).issubset(routes.paths)
+    
+    # Check interview engine methods
+    engine_methods = ["_get_session"]
+    engine_complete = set(engine_methods).issubset(_declared_methods(InterviewEngine))
+    
+    # Check performance analyzer methods for trends
+    trend_methods = ["_analyze_performance_trends"]
+    trend_complete = set(trend_methods).issubset(_declared_methods(PerformanceAnalyzer))
+    
+    return has_history_endpoints and engine_complete and trend_complete
+
+def _check_models(routes: RouteIndex) -> bool:
+    """Essential interview model fields."""
+    session_fields = ["interview_type", "status", "overall_score", "ai_feedback"]
+    question_fields = ["question_text", "category", "difficulty_level", "generated_by_ai"]
+    response_fields = ["response_text", "overall_score", "ai_feedback", "improvement_suggestions"]
+    
+    return (
+        set(session_fields).issubset(_model_attrs(InterviewSession)) and
+        set(question_fields).issubset(_model_attrs(InterviewQuestion)) and
+        set(response_fields).issubset(_model_attrs(InterviewResponse))
+    )
+
+def _check_ai_integration(routes: RouteIndex) -> bool:
+    """Groq client AI integration."""
+    ai_methods = [
+        "generate_interview_questions",
+        "analyze_interview_response", 
+        "generate_followup_question"
+    ]
+    
+    return set(ai_methods).issubset(_declared_methods(GroqClient))
+
+# Independent checks, run in report order; one failing check does not affect the others
+CHECKS = (
+    Check("interview_session_management", "Interview Session Management",
+          "Session management endpoints implemented", "Missing session management endpoints",
+          True, _check_session_endpoints),
+    Check("real_time_ai_interviewer", "Real-time AI Interviewer",
+          "Real-time AI interviewer implemented", "Real-time AI interviewer incomplete",
+          True, _check_realtime),
+    Check("performance_analysis", "Performance Analysis",
+          "Performance analysis implemented", "Performance analysis incomplete",
+          True, _check_performance_analysis),
+    Check("feedback_recommendations", "Feedback and Recommendations",
+          "Feedback and recommendations implemented", "Feedback and recommendations incomplete",
+          True, _check_feedback),
+    Check("interview_history_tracking", "History and Progress Tracking",
+          "History and progress tracking implemented", "History and progress tracking incomplete",
+          True, _check_history),
+    Check("database_models", "Database Models",
+          "Database models properly defined", "Database models incomplete",
+          False, _check_models),
+    Check("ai_integration", "AI Integration",
+          "AI integration implemented", "AI integration incomplete",
+          False, _check_ai_integration)
+)
+
+# Checks that count towards task 8.2 completion
+REQUIREMENTS = tuple(check.key for check in CHECKS if check.required)
+
+@functools.lru_cache(maxsize=1)
+def _compute_requirements(routes: RouteIndex) -> Tuple[Dict[str, bool], Dict[str, str]]:
+    """Run every interview check, returning the results and any check errors."""
+    results = {}
+    errors = {}
+    for check in CHECKS:
+        try:
+            results[check.key] = check.run(routes)
+        except Exception as e:
+            results[check.key] = False
+            errors[check.key] = str(e)
+    return results, errors
+
+def _report_requirements(results: Dict[str, bool], errors: Dict[str, str]) -> bool:
+    """Print the step results and completion summary."""
+    for number, check in enumerate(CHECKS, 1):
+        emit(f"\n{number}. Testing {check.title}...")
+        if check.key in errors:
+            emit(f"   ✗ {check.key}: {errors[check.key]}")
         else:
-            print("   ✗ AI integration incomplete")
-        
-    except ImportError as e:
-        print(f"   ✗ Import error: {e}")
-        return False
-    except Exception as e:
-        print(f"   ✗ Validation error: {e}")
-        return False
+            emit(f"   ✓ {check.met}" if results[check.key] else f"   ✗ {check.not_met}")
     
     # Summary
-    print("\n" + "=" * 60)
-    print("📊 VALIDATION SUMMARY")
-    print("=" * 60)
+    emit("\n" + "=" * 60)
+    emit("📊 VALIDATION SUMMARY")
+    emit("=" * 60)
     
-    total_requirements = len(requirements)
-    completed_requirements = sum(requirements.values())
+    total_requirements = len(REQUIREMENTS)
+    completed_requirements = sum(results[req_name] for req_name in REQUIREMENTS)
     
-    for req_name, completed in requirements.items():
-        status = "✓" if completed else "✗"
-        print(f"   {status} {req_name.replace('_', ' ').title()}")
+    for req_name in REQUIREMENTS:
+        status = "✓" if results[req_name] else "✗"
+        emit(f"   {status} {req_name.replace('_', ' ').title()}")
     
     completion_percentage = (completed_requirements / total_requirements) * 100
     
-    print(f"\n📈 Completion: {completed_requirements}/{total_requirements} ({completion_percentage:.1f}%)")
+    emit(f"\n📈 Completion: {completed_requirements}/{total_requirements} ({completion_percentage:.1f}%)")
     
     if completion_percentage == 100:
-        print("\n🎉 ALL REQUIREMENTS COMPLETED!")
-        print("   Task 8.2 'Build mock interview API' is fully implemented.")
+        emit("\n🎉 ALL REQUIREMENTS COMPLETED!")
+        emit("   Task 8.2 'Build mock interview API' is fully implemented.")
         return True
     elif completion_percentage >= 80:
-        print("\n✅ MOSTLY COMPLETE")
-        print("   Core functionality implemented, minor enhancements may be needed.")
+        emit("\n✅ MOSTLY COMPLETE")
+        emit("   Core functionality implemented, minor enhancements may be needed.")
         return True
     else:
-        print("\n⚠️  NEEDS MORE WORK")
-        print("   Significant implementation gaps remain.")
+        emit("\n⚠️  NEEDS MORE WORK")
+        emit("   Significant implementation gaps remain.")
         return False
 
-def validate_api_endpoints():
-    """Validate specific API endpoint functionality."""
+def validate_task_requirements(routes: RouteIndex):
+    """Validate that all task 8.2 requirements are implemented."""
     
-    print("\n🔧 DETAILED API ENDPOINT VALIDATION")
-    print("=" * 60)
+    emit("🔍 Validating Mock Interview API Implementation (Task 8.2)")
+    emit("=" * 60)
     
     try:
-        from app.api.v1.endpoints.interview import router
-        
-        # Group endpoints by functionality
-        endpoint_groups = {
-            "Session Management": [
-                ("POST", "/sessions"),
-                ("POST", "/sessions/scenario/{interview_type}"),
-                ("GET", "/sessions"),
-                ("GET", "/sessions/{session_id}"),
-                ("POST", "/sessions/{session_id}/start"),
-                ("POST", "/sessions/{session_id}/pause"),
-                ("POST", "/sessions/{session_id}/resume"),
-                ("POST", "/sessions/{session_id}/complete")
-            ],
-            "Question Management": [
-                ("GET", "/sessions/{session_id}/next-question"),
-                ("POST", "/sessions/{session_id}/questions/{question_id}/respond"),
-                ("POST", "/sessions/{session_id}/generate-questions")
-            ],
-            "Analysis & Feedback": [
-                ("GET", "/sessions/{session_id}/performance-analysis"),
-                ("GET", "/sessions/{session_id}/improvement-plan"),
-                ("GET", "/analytics")
-            ],
-            "Real-time Features": [
-                ("WebSocket", "/sessions/{session_id}/realtime"),
-                ("GET", "/sessions/{session_id}/progress-tracking")
-            ]
-        }
+        if _IMPORT_ERROR is not None:
+            emit(f"   ✗ Import error: {_IMPORT_ERROR}")
+            return False
         
-        router_info = {}
-        for route in router.routes:
-            methods = getattr(route, 'methods', {'GET'})
-            for method in methods:
-                if method != 'HEAD':  # Skip HEAD methods
-                    key = (method, route.path)
-                    router_info[key] = route
-        
-        all_endpoints_found = True
+        return _report_requirements(*_compute_requirements(routes))
+    finally:
+        _flush_output()
+
+# Expected endpoints grouped by functionality, in report order
+_ENDPOINT_GROUPS = (
+    ("Session Management", (
+        ("POST", "/sessions"),
+        ("POST", "/sessions/scenario/{interview_type}"),
+        ("GET", "/sessions"),
+        ("GET", "/sessions/{session_id}"),
+        ("POST", "/sessions/{session_id}/start"),
+        ("POST", "/sessions/{session_id}/pause"),
+        ("POST", "/sessions/{session_id}/resume"),
+        ("POST", "/sessions/{session_id}/complete")
+    )),
+    ("Question Management", (
+        ("GET", "/sessions/{session_id}/next-question"),
+        ("POST", "/sessions/{session_id}/questions/{question_id}/respond"),
+        ("POST", "/sessions/{session_id}/generate-questions")
+    )),
+    ("Analysis & Feedback", (
+        ("GET", "/sessions/{session_id}/performance-analysis"),
+        ("GET", "/sessions/{session_id}/improvement-plan"),
+        ("GET", "/analytics")
+    )),
+    ("Real-time Features", (
+        ("WebSocket", "/sessions/{session_id}/realtime"),
+        ("GET", "/sessions/{session_id}/progress-tracking")
+    ))
+)
+
+@functools.lru_cache(maxsize=1)
+def _compute_endpoint_coverage(routes: RouteIndex) -> Tuple[Tuple[str, Tuple[Tuple[str, str, bool], ...]], ...]:
+    """Resolve each grouped endpoint to (method, path, found)."""
+    return tuple(
+        (group_name, tuple(
+            # Special handling for WebSocket
+            (method, path, routes.has_realtime if method == "WebSocket" else (method, path) in routes.method_paths)
+            for method, path in endpoints
+        ))
+        for group_name, endpoints in _ENDPOINT_GROUPS
+    )
+
+def _report_endpoint_coverage(coverage) -> bool:
+    """Print each endpoint group and whether every endpoint was found."""
+    all_endpoints_found = True
+    
+    for group_name, endpoints in coverage:
+        emit(f"\n{group_name}:")
         
-        for group_name, endpoints in endpoint_groups.items():
-            print(f"\n{group_name}:")
-            group_complete = True
-            
-            for method, path in endpoints:
-                if method == "WebSocket":
-                    # Special handling for WebSocket
-                    found = any("/realtime" in route.path for route in router.routes)
-                    status = "✓" if found else "✗"
-                    if not found:
-                        group_complete = False
-                else:
-                    found = (method, path) in router_info
-                    status = "✓" if found else "✗"
-                    if not found:
-                        group_complete = False
-                
-                print(f"   {status} {method} {path}")
-            
-            if not group_complete:
+        for method, path, found in endpoints:
+            status = "✓" if found else "✗"
+            if not found:
                 all_endpoints_found = False
-        
-        return all_endpoints_found
-        
-    except Exception as e:
-        print(f"Error validating endpoints: {e}")
-        return False
+            
+            emit(f"   {status} {method} {path}")
+    
+    return all_endpoints_found
+
+def validate_api_endpoints(routes: RouteIndex):
+    """Validate specific API endpoint functionality."""
+    
+    emit("\n🔧 DETAILED API ENDPOINT VALIDATION")
+    emit("=" * 60)
+    
+    try:
+        if _IMPORT_ERROR is not None:
+            emit(f"Error validating endpoints: {_IMPORT_ERROR}")
+            return False
+        
+        try:
+            coverage = _compute_endpoint_coverage(routes)
+        except Exception as e:
+            emit(f"Error validating endpoints: {e}")
+            return False
+        
+        return _report_endpoint_coverage(coverage)
+    finally:
+        _flush_output()
 
 if __name__ == "__main__":
-    print("🚀 Starting Mock Interview API Validation")
+    emit("🚀 Starting Mock Interview API Validation")
+    
+    # Walk the router once for both validations
+    routes = _index_router(router) if _IMPORT_ERROR is None else None
     
     # Run main validation
-    requirements_met = validate_task_requirements()
+    requirements_met = validate_task_requirements(routes)
     
     # Run detailed endpoint validation
-    endpoints_complete = validate_api_endpoints()
+    endpoints_complete = validate_api_endpoints(routes)
     
-    print("\n" + "=" * 60)
-    print("🏁 FINAL VALIDATION RESULT")
-    print("=" * 60)
+    emit("\n" + "=" * 60)
+    emit("🏁 FINAL VALIDATION RESULT")
+    emit("=" * 60)
     
     if requirements_met and endpoints_complete:
-        print("✅ TASK 8.2 SUCCESSFULLY COMPLETED!")
-        print("\nThe mock interview API has been fully implemented with:")
-        print("   • Complete session management")
-        print("   • Real-time AI interviewer interaction")
-        print("   • Comprehensive performance analysis")
-        print("   • Detailed feedback and recommendations")
-        print("   • Interview history and progress tracking")
-        print("\nAll requirements from task 8.2 have been satisfied.")
+        emit("✅ TASK 8.2 SUCCESSFULLY COMPLETED!")
+        emit("\nThe mock interview API has been fully implemented with:")
+        emit("   • Complete session management")
+        emit("   • Real-time AI interviewer interaction")
+        emit("   • Comprehensive performance analysis")
+        emit("   • Detailed feedback and recommendations")
+        emit("   • Interview history and progress tracking")
+        emit("\nAll requirements from task 8.2 have been satisfied.")
     else:
-        print("⚠️  TASK 8.2 NEEDS ATTENTION")
+        emit("⚠️  TASK 8.2 NEEDS ATTENTION")
         if not requirements_met:
-            print("   • Core requirements not fully met")
+            emit("   • Core requirements not fully met")
         if not endpoints_complete:
-            print("   • API endpoints incomplete")
\ No newline at end of file
+            emit("   • API endpoints incomplete")
+    
+    _flush_output()